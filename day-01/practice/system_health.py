@@ -9,52 +9,109 @@
 # # This is your first step towards thinking like a DevOps engineer using Python.
 
 
+import time
+from collections import namedtuple
+from functools import wraps
+
 import psutil
 
-# Function to check CPU usage
-def check_cpu(threshold):
-    cpu_usage = psutil.cpu_percent(interval=1)
-    print(f"CPU Usage: {cpu_usage}%")
+# Prime the CPU counter once at startup.
+# psutil.cpu_percent(interval=None) compares against the previous call,
+# so the first call only records a starting point and returns 0.0.
+# The next call then reports usage since this moment without sleeping.
+psutil.cpu_percent(interval=None)
+cpu_sampled_at = time.monotonic()
 
-    if cpu_usage > threshold:
-        print(" CPU usage is above threshold")
-    else:
-        print(" CPU usage is within limit")
+# Shortest CPU sampling window in seconds.
+# Over a shorter window the reading is mostly noise (often 0.0 or 100.0),
+# so snapshot() waits out whatever is left of it.
+MIN_CPU_WINDOW = 0.1
 
 
-# Function to check Memory usage
-def check_memory(threshold):
-    memory = psutil.virtual_memory()
-    memory_usage = memory.percent
-    print(f"Memory Usage: {memory_usage}%")
+# Decorator that remembers a function's result for a few seconds.
+# Useful when the health check runs in a loop: repeated calls inside
+# the window return the stored value instead of reading /proc again.
+def ttl_cache(seconds=1.0):
+    def decorator(func):
+        cache = {}  # args -> (value, time it was stored)
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            if args in cache:
+                value, stored_at = cache[args]
+                if now - stored_at < seconds:
+                    return value
+            value = func(*args)
+            cache[args] = (value, now)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@ttl_cache(seconds=1.0)
+def virtual_memory():
+    return psutil.virtual_memory()
+
+
+@ttl_cache(seconds=1.0)
+def disk_usage(path):
+    return psutil.disk_usage(path)
 
-    if memory_usage > threshold:
-        print(" Memory usage is above threshold")
-    else:
-        print(" Memory usage is within limit")
 
+# All three metrics in one place
+Snapshot = namedtuple("Snapshot", ["cpu", "memory", "disk"])
 
-# Function to check Disk usage
-def check_disk(threshold):
-    disk = psutil.disk_usage('/')
-    disk_usage = disk.percent
-    print(f"Disk Usage: {disk_usage}%")
 
-    if disk_usage > threshold:
-        print("Disk usage is above threshold")
+# Function to read every metric in one burst
+def snapshot():
+    # Memory and disk reads are cheap, do them first so the CPU
+    # sampling window covers as much time as possible
+    memory = virtual_memory().percent
+    disk = disk_usage('/').percent
+    # CPU usage since the last call, over at least MIN_CPU_WINDOW seconds
+    global cpu_sampled_at
+    elapsed = time.monotonic() - cpu_sampled_at
+    if elapsed < MIN_CPU_WINDOW:
+        time.sleep(MIN_CPU_WINDOW - elapsed)
+    cpu = psutil.cpu_percent(interval=None)
+    cpu_sampled_at = time.monotonic()
+    return Snapshot(cpu, memory, disk)
+
+
+# Function to print a metric and compare it against its threshold
+def report(name, usage, threshold):
+    print(f"{name} Usage: {usage}%")
+
+    if usage > threshold:
+        print(f" {name} usage is above threshold")
     else:
-        print(" Disk usage is within limit")
+        print(f" {name} usage is within limit")
 
 
-# ---- Main Program ----
-print("Enter threshold values (%)")
+# Function to compare a whole snapshot against its thresholds
+def check_health(usage, thresholds):
+    print("\n--- System Health Check ---")
+
+    for name, value, threshold in zip(("CPU", "Memory", "Disk"), usage, thresholds):
+        report(name, value, threshold)
 
-cpu_threshold = float(input("CPU Threshold: "))
-memory_threshold = float(input("Memory Threshold: "))
-disk_threshold = float(input("Disk Threshold: "))
 
-print("\n--- System Health Check ---")
+def main():
+    print("Enter threshold values (%)")
 
-check_cpu(cpu_threshold)
-check_memory(memory_threshold)
-check_disk(disk_threshold)
+    cpu_threshold = float(input("CPU Threshold: "))
+    memory_threshold = float(input("Memory Threshold: "))
+    disk_threshold = float(input("Disk Threshold: "))
+
+    usage = snapshot()
+    thresholds = Snapshot(cpu_threshold, memory_threshold, disk_threshold)
+
+    check_health(usage, thresholds)
+
+
+# ---- Main Program ----
+if __name__ == "__main__":
+    main()
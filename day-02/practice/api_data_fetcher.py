@@ -4,6 +4,16 @@ import requests
 # Import json module to work with JSON data (read/write)
 import json
 
+# Modules for the on-disk response cache
+import hashlib
+import os
+import time
+from datetime import datetime
+
+# Connection pooling and automatic retries for the session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Public API URL 
 API_URL = "https://jsonplaceholder.typicode.com/users"
 
@@ -11,19 +21,133 @@ API_URL = "https://jsonplaceholder.typicode.com/users"
 OUTPUT_FILE = "output.json"
 
 
+class FileCache:
+    """
+    Simple on-disk cache for API responses (same as day-03's FileCache).
+
+    Each response body is stored as-is (raw JSON bytes) under
+    <directory>/<group>/<key>.json, where the key is a SHA256 hash of the
+    request method and URL. Entries older than ttl_seconds are ignored.
+    get() also returns when the entry was stored (the file's mtime).
+
+    mode controls how the cache is used:
+    - "enabled":    read cached responses and store new ones (default)
+    - "read-only":  read cached responses, never store new ones
+    - "write-only": always call the API and refresh the cache
+    - "replay":     only use cached responses (expired ones too) and
+                    never call the API; a missing entry is an error
+    """
+
+    MODES = ("enabled", "read-only", "write-only", "replay")
+
+    def __init__(self, directory=".cache", ttl_seconds=24 * 60 * 60, mode="enabled"):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+
+    @property
+    def can_read(self):
+        return self.mode != "write-only"
+
+    @property
+    def can_write(self):
+        return self.mode in ("enabled", "write-only")
+
+    @staticmethod
+    def make_key(method, url):
+        return hashlib.sha256(f"{method}{url}".encode()).hexdigest()
+
+    def _path(self, group, key):
+        return os.path.join(self.directory, group, f"{key}.json")
+
+    def get(self, group, key):
+        # Returns (content, stored_at), or None if there is no usable entry
+        if not self.can_read:
+            return None
+        path = self._path(group, key)
+        try:
+            # Treat expired entries the same as missing ones
+            # (replay mode keeps using them, since it can't refetch)
+            stored_at = os.path.getmtime(path)
+            if self.mode != "replay" and time.time() - stored_at > self.ttl_seconds:
+                return None
+            with open(path, "rb") as file:
+                return file.read(), datetime.fromtimestamp(stored_at)
+        except OSError:
+            return None
+
+    def set(self, group, key, content):
+        if not self.can_write:
+            return
+        path = self._path(group, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(content)
+        except OSError as error:
+            # A failed cache write should never break the main flow
+            print(f"  Warning: could not write cache file: {error}")
+
+
+# Cache mode comes from the CACHE_MODE environment variable, e.g.
+#   CACHE_MODE=replay python api_data_fetcher.py
+# to rerun against saved responses without touching the API
+CACHE_MODE = os.environ.get("CACHE_MODE", "enabled").lower()
+if CACHE_MODE not in FileCache.MODES:
+    print(f"  Warning: unknown CACHE_MODE '{CACHE_MODE}', using 'enabled'")
+    CACHE_MODE = "enabled"
+
+# Shared response cache (24 hour expiry)
+_CACHE = FileCache(mode=CACHE_MODE)
+
+# One shared session for the whole script.
+# It keeps TCP/TLS connections open and reuses them between calls,
+# and retries temporary server errors with a growing wait in between.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
+
 def fetch_api_data():
     """
-    Fetch data from the public API
+    Fetch data from the public API (or the local cache)
     Returns parsed JSON data (Python list of dictionaries)
     """
-    # Send GET request to API
-    response = requests.get(API_URL)
+    cache_key = FileCache.make_key("GET", API_URL)
+
+    # Use the cached response if we have one
+    cached = _CACHE.get("users", cache_key)
+    if cached is not None:
+        print(" Using cached API response")
+        content, _ = cached
+        return json.loads(content)
+
+    # In replay mode a missing cache entry is an error
+    if _CACHE.mode == "replay":
+        raise RuntimeError(f"No cached response for {API_URL} (CACHE_MODE=replay)")
+
+    # Send GET request to API (reusing the pooled connection)
+    response = _SESSION.get(API_URL)
 
     # Raise an exception if API call fails (status code != 200)
     response.raise_for_status()
 
     # Convert JSON response into Python object
-    return response.json()
+    # This runs before caching, so a truncated or non-JSON body
+    # raises here and is never saved for later runs
+    users = response.json()
+
+    # Save the raw response for the next run
+    _CACHE.set("users", cache_key, response.content)
+
+    return users
 
 
 def process_data(users):
@@ -6,6 +6,7 @@ and saves it to a JSON file with proper error handling and validation.
 
 Features:
 - Interactive user input with validation
+- Batch mode: --symbols IBM,AAPL,MSFT fetches several stocks concurrently
 - Comprehensive error handling
 - Automatic directory creation
 - Timestamped output files
@@ -15,11 +16,164 @@ Author: DevOps Learning Path
 Date: Day 03 - Error Handling & Code Structure
 """
 
+import argparse  # Command line options
 import requests  # HTTP library for API calls
 import json      # JSON parsing and creation
+import orjson    # Fast JSON serializer used for the output file
 import os        # Operating system interactions (file/directory operations)
 import sys       # System-specific parameters and functions
+import time      # Timestamps for cache expiry
+import hashlib   # Hashing request parameters into cache keys
+import random    # Jitter for retry delays
+import threading # Lock shared by the rate limiter across threads
+from concurrent.futures import ThreadPoolExecutor, as_completed  # Parallel fetches
 from datetime import datetime  # Date and time handling
+from requests.adapters import HTTPAdapter  # Connection pooling for sessions
+
+
+# Shared HTTP session used for every API call
+# Reusing one session keeps the TCP/TLS connection open, so repeated
+# requests skip the DNS lookup and TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    # No automatic retries here: the retry loop in fetch_stock_data()
+    # handles every temporary failure, so each new attempt also goes
+    # through the rate limiter
+    max_retries=0
+))
+
+# HTTP status codes worth retrying: rate limits and temporary server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# How many times fetch_stock_data() tries before giving up
+MAX_ATTEMPTS = 4
+
+# Most symbols fetched at the same time in batch mode
+# (stays below the session's connection pool size of 10)
+MAX_WORKERS = 5
+
+
+class FileCache:
+    """
+    Simple on-disk cache for API responses.
+
+    Each response body is stored as-is (raw JSON bytes) under
+    <directory>/<symbol>/<key>.json, where the key is a SHA256 hash of the
+    request URL and query. Entries older than ttl_seconds are ignored.
+    This keeps repeated runs from spending the free-tier daily quota.
+    get() also returns when the entry was stored (the file's mtime), which
+    is when that response was actually fetched from the API.
+
+    mode controls how the cache is used:
+    - "enabled":    read cached responses and store new ones (default)
+    - "read-only":  read cached responses, never store new ones
+    - "write-only": always call the API and refresh the cache
+    - "replay":     only use cached responses (expired ones too) and
+                    never call the API; a missing entry is an error
+    """
+
+    MODES = ("enabled", "read-only", "write-only", "replay")
+
+    def __init__(self, directory=".cache", ttl_seconds=24 * 60 * 60, mode="enabled"):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+
+    @property
+    def can_read(self):
+        return self.mode != "write-only"
+
+    @property
+    def can_write(self):
+        return self.mode in ("enabled", "write-only")
+
+    @staticmethod
+    def make_key(api_url, query):
+        return hashlib.sha256(f"{api_url}{query}".encode()).hexdigest()
+
+    def _path(self, symbol, key):
+        return os.path.join(self.directory, symbol, f"{key}.json")
+
+    def get(self, symbol, key):
+        # Returns (content, stored_at), or None if there is no usable entry
+        if not self.can_read:
+            return None
+        path = self._path(symbol, key)
+        try:
+            # Treat expired entries the same as missing ones
+            # (replay mode keeps using them, since it can't refetch)
+            stored_at = os.path.getmtime(path)
+            if self.mode != "replay" and time.time() - stored_at > self.ttl_seconds:
+                return None
+            with open(path, "rb") as file:
+                return file.read(), datetime.fromtimestamp(stored_at)
+        except OSError:
+            return None
+
+    def set(self, symbol, key, content):
+        if not self.can_write:
+            return
+        path = self._path(symbol, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(content)
+        except OSError as error:
+            # A failed cache write should never break the main flow
+            print(f"  Warning: could not write cache file: {error}")
+
+
+# Cache mode comes from the CACHE_MODE environment variable, e.g.
+#   CACHE_MODE=replay python api_data_fetcher.py
+# to rerun against saved responses without touching the API
+CACHE_MODE = os.environ.get("CACHE_MODE", "enabled").lower()
+if CACHE_MODE not in FileCache.MODES:
+    print(f"  Warning: unknown CACHE_MODE '{CACHE_MODE}', using 'enabled'")
+    CACHE_MODE = "enabled"
+
+# Shared response cache (24 hour expiry)
+_CACHE = FileCache(mode=CACHE_MODE)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    The bucket holds up to `rate` tokens and refills continuously at
+    `rate` tokens per `period` seconds. Each request takes one token;
+    when the bucket is empty, acquire() sleeps until a token is available.
+    A lock makes it safe to share between threads.
+    """
+
+    def __init__(self, rate, period=60.0):
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        # Threads wait their turn, so tokens are handed out in order
+        with self.lock:
+            while True:
+                # Refill based on how much time has passed
+                now = time.monotonic()
+                elapsed = now - self.last_update
+                self.tokens = min(self.rate, self.tokens + elapsed * self.rate / self.period)
+                self.last_update = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                # Wait just long enough for the next token
+                time.sleep((1 - self.tokens) * self.period / self.rate)
+
+
+# Alpha Vantage free tier allows 5 requests per minute
+_RATE_LIMITER = TokenBucket(rate=5, period=60.0)
 
 
 def validate_api_key(api_key):
@@ -43,85 +197,140 @@ def validate_stock_symbol(symbol):
 
 
 def fetch_stock_data(api_url, api_key, symbol):
-    try:
-        # Build the query string with API parameters
-        # function: Type of data to fetch (TIME_SERIES_DAILY)
-        # symbol: Which stock to look up
-        # apikey: Authentication credential
-        query = (
-            f"function=TIME_SERIES_DAILY"
-            f"&symbol={symbol}"
-            f"&apikey={api_key}"
-        )
-
-        print(f" Requesting data for {symbol}...")
-        
-        # Send GET request with 10-second timeout to prevent hanging
-        response = requests.get(api_url + query, timeout=10)
-        
-        # Raise exception if HTTP status code indicates error (4xx or 5xx)
-        response.raise_for_status()
-
-        # Parse JSON response into Python dictionary
-        data = response.json()
+    # Build the query string with API parameters
+    # function: Type of data to fetch (TIME_SERIES_DAILY)
+    # symbol: Which stock to look up
+    # outputsize: "compact" returns only the latest 100 days, which keeps
+    #             the payload small (the "full" 20-year history is several MB)
+    # apikey: Authentication credential
+    query = (
+        f"function=TIME_SERIES_DAILY"
+        f"&symbol={symbol}"
+        f"&outputsize=compact"
+        f"&apikey={api_key}"
+    )
 
-        # Check for API-specific error messages
-        # Alpha Vantage returns different keys for different error types
-        if "Error Message" in data:
-            print(f" API Error: Invalid stock symbol '{symbol}'")
-            return None
-        
-        # Check if we've hit the API rate limit
-        # Free tier allows 25 requests per day
-        if "Note" in data:
-            print(f"  API Rate Limit: {data['Note']}")
+    # Return the cached response if we fetched this recently,
+    # along with the time it was originally fetched
+    cache_key = FileCache.make_key(api_url, query)
+    cached = _CACHE.get(symbol, cache_key)
+    if cached is not None:
+        print(f" Using cached data for {symbol}")
+        return cached
+
+    # Replay mode never calls the API
+    if _CACHE.mode == "replay":
+        print(f" Error: No cached data for {symbol} (CACHE_MODE=replay)")
+        return None
+
+    # Retry loop for temporary failures (timeouts, dropped connections,
+    # 429 rate limits, 5xx server errors, truncated responses).
+    # Other errors are reported and return None.
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        # Seconds the server asked us to wait (Retry-After header)
+        retry_after = 0
+        try:
+            # Wait for a free slot so we stay under the per-minute limit
+            _RATE_LIMITER.acquire()
+
+            print(f" Requesting data for {symbol}...")
+
+            # Send GET request with 10-second timeout to prevent hanging
+            response = _SESSION.get(api_url + query, timeout=10)
+
+            # Raise exception if HTTP status code indicates error (4xx or 5xx)
+            response.raise_for_status()
+
+            # Keep the response as raw bytes
+            # The body is saved to disk unchanged, so there is no need to
+            # parse it into Python objects and serialize it again
+            content = response.content
+
+            # Check for API-specific error messages
+            # Alpha Vantage returns different keys for different error types
+            # A plain byte search is enough to spot them
+            if b'"Error Message"' in content:
+                print(f" API Error: Invalid stock symbol '{symbol}'")
+                return None
+
+            # Check if we've hit the API rate limit
+            # Free tier allows 25 requests per day
+            # Rate-limit replies are tiny, so parsing one to show the note is cheap
+            if b'"Note"' in content:
+                print(f"  API Rate Limit: {json.loads(content)['Note']}")
+                return None
+
+            # Verify the response has the expected data structure
+            # "Time Series (Daily)" contains the actual stock price data
+            if b'"Time Series (Daily)"' not in content:
+                print(" Unexpected API response format")
+                return None
+
+            # Make sure the body is complete, well-formed JSON before it is
+            # cached and saved; a truncated body raises JSONDecodeError
+            # below and is fetched again
+            orjson.loads(content)
+
+            print(f" Successfully fetched data for {symbol}")
+            fetched_at = datetime.now()
+
+            # Only cache valid responses, never errors or rate-limit notes
+            _CACHE.set(symbol, cache_key, content)
+            return content, fetched_at
+
+        # Handle specific exception types for better error messages
+        except requests.exceptions.Timeout:
+            # Request took longer than specified timeout
+            print(" Error: Request timed out after 10 seconds")
+        except requests.exceptions.ConnectionError:
+            # No internet connection or server unreachable
+            print(" Error: Unable to connect to API (check internet connection)")
+        except requests.exceptions.HTTPError as error:
+            # Server returned error status code (4xx or 5xx)
+            print(f" HTTP Error: {error}")
+            # Other client errors (bad request, auth...) won't fix themselves
+            if error.response.status_code not in RETRY_STATUSES:
+                return None
+            # Rate limit or temporary server error: wait and retry
+            # through the rate limiter, at least as long as the server asks
+            header = error.response.headers.get("Retry-After", "")
+            retry_after = int(header) if header.isdigit() else 0
+        except json.JSONDecodeError:
+            # Response body is not valid JSON (e.g. a cut-off response)
+            # orjson.JSONDecodeError is a subclass, so it lands here too
+            # Checked before RequestException because requests raises
+            # its own JSONDecodeError that inherits from both
+            print(" Error: Invalid JSON response from API")
+        except requests.exceptions.RequestException as error:
+            # Catch-all for other requests-related errors
+            print(f" Network error: {error}")
             return None
-
-        # Verify the response has the expected data structure
-        # "Time Series (Daily)" contains the actual stock price data
-        if "Time Series (Daily)" not in data:
-            print(" Unexpected API response format")
+        except Exception as error:
+            # Catch any other unexpected errors
+            print(f" Unexpected error: {error}")
             return None
 
-        print(f" Successfully fetched data for {symbol}")
-        return data
-
-    # Handle specific exception types for better error messages
-    except requests.exceptions.Timeout:
-        # Request took longer than specified timeout
-        print(" Error: Request timed out after 10 seconds")
-    except requests.exceptions.ConnectionError:
-        # No internet connection or server unreachable
-        print(" Error: Unable to connect to API (check internet connection)")
-    except requests.exceptions.HTTPError as error:
-        # Server returned error status code (4xx or 5xx)
-        print(f" HTTP Error: {error}")
-    except requests.exceptions.RequestException as error:
-        # Catch-all for other requests-related errors
-        print(f" Network error: {error}")
-    except json.JSONDecodeError:
-        # Response body is not valid JSON
-        print(" Error: Invalid JSON response from API")
-    except Exception as error:
-        # Catch any other unexpected errors
-        print(f" Unexpected error: {error}")
+        # Only temporary errors reach this point: wait and try again
+        # Exponential backoff (2, 4, 8... seconds) plus random jitter,
+        # or longer if the server asked for it
+        if attempt < MAX_ATTEMPTS:
+            delay = max(2 ** attempt + random.random(), retry_after)
+            print(f" Retrying in {delay:.1f} seconds (attempt {attempt + 1}/{MAX_ATTEMPTS})...")
+            time.sleep(delay)
 
-    # Return None if any error occurred
+    # Return None if every attempt failed
     return None
 
 
-def save_data_to_file(data, filename, symbol):
+def save_data_to_file(content, filename, symbol, fetched_at):
 
     try:
-        # Create a structured output with metadata
+        # Metadata stored alongside the stock data
         # This helps track when data was fetched and what version of script was used
-        output_data = {
-            "metadata": {
-                "symbol": symbol,
-                "fetched_at": datetime.now().isoformat(),  # ISO format timestamp
-                "script_version": "1.1"
-            },
-            "stock_data": data  # The actual API response
+        metadata = {
+            "symbol": symbol,
+            "fetched_at": fetched_at,  # orjson writes it as an ISO timestamp
+            "script_version": "1.1"
         }
         
         # Extract directory path from filename (if any)
@@ -133,12 +342,18 @@ def save_data_to_file(data, filename, symbol):
             os.makedirs(directory)
             print(f" Created directory: {directory}")
 
-        # Open file in write mode with UTF-8 encoding
-        # UTF-8 ensures proper handling of special characters
-        with open(filename, "w", encoding="utf-8") as file:
-            # Write data as formatted JSON
-            # indent=4 makes the file human-readable
-            json.dump(output_data, file, indent=4)
+        # Open file in binary write mode
+        # orjson produces UTF-8 encoded bytes, so no text encoding step is needed
+        with open(filename, "wb") as file:
+            # Write the output object piece by piece:
+            # {"metadata": ..., "stock_data": ...}
+            # This avoids building one combined dictionary just to serialize it
+            # OPT_INDENT_2 makes the file human-readable
+            file.write(b'{\n"metadata": ')
+            file.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            file.write(b',\n"stock_data": ')
+            file.write(content)  # The actual API response, copied byte for byte
+            file.write(b"\n}\n")
 
         # Get file size and display to user
         # Provides feedback on how much data was saved
@@ -201,6 +416,54 @@ def get_user_input(prompt, default=None, validator=None):
             sys.exit(1)
 
 
+def parse_symbols(value):
+    """
+    Turns a comma-separated list like "IBM,aapl, MSFT" into
+    ["IBM", "AAPL", "MSFT"], dropping duplicates
+    """
+    symbols = []
+    for symbol in value.split(","):
+        symbol = symbol.strip().upper()
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+def parse_args():
+    """
+    Reads optional command line arguments.
+    Anything not given on the command line is asked for interactively.
+    """
+    parser = argparse.ArgumentParser(description="Fetch daily stock data from Alpha Vantage")
+    parser.add_argument(
+        "--symbols",
+        type=parse_symbols,
+        help="comma-separated stock symbols to fetch in one run, e.g. IBM,AAPL,MSFT"
+    )
+    parser.add_argument("--api-key", help="Alpha Vantage API key")
+    return parser.parse_args()
+
+
+def fetch_all(api_url, api_key, symbols):
+    """
+    Fetches several symbols at the same time.
+    Network waits overlap, so the total time is close to the slowest
+    single request instead of the sum of all of them. The shared rate
+    limiter still keeps the requests under the API limit.
+    Returns a dictionary of symbol -> (response bytes, fetched_at),
+    or None on failure.
+    """
+    if len(symbols) == 1:
+        return {symbols[0]: fetch_stock_data(api_url, api_key, symbols[0])}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(symbols))) as executor:
+        futures = {
+            executor.submit(fetch_stock_data, api_url, api_key, symbol): symbol
+            for symbol in symbols
+        }
+        return {futures[future]: future.result() for future in as_completed(futures)}
+
+
 def main():
     """
     Main function that coordinates the program flow.
@@ -212,6 +475,8 @@ def main():
     4. Data saving to file
     5. Success/failure reporting
     """
+    args = parse_args()
+
     # Display welcome banner
     print("=" * 60)
     print(" Stock Market Data Fetcher - Enhanced Version")
@@ -221,9 +486,9 @@ def main():
     # Configuration - API endpoint URL
     api_url = "https://www.alphavantage.co/query?"
     
-    # Get API key from user with validation
+    # Get API key from the command line or from the user
     # 'demo' is Alpha Vantage's public demo key for testing
-    api_key = get_user_input(
+    api_key = args.api_key or get_user_input(
         "Enter your Alpha Vantage API key",
         default="demo"  # Allow testing without real API key
     )
@@ -232,46 +497,70 @@ def main():
     if not validate_api_key(api_key) and api_key != "demo":
         print("  Warning: API key looks invalid (using anyway)")
     
-    # Get stock symbol from user with format validation
-    stock_symbol = get_user_input(
-        "Enter stock symbol (e.g., IBM, AAPL, MSFT)",
-        default="IBM",
-        validator=validate_stock_symbol  # Ensures proper format
-    )
+    # Get stock symbols from the command line, or one symbol from the user
+    if args.symbols:
+        invalid = [symbol for symbol in args.symbols if not validate_stock_symbol(symbol)]
+        if invalid:
+            print(f" Error: Invalid stock symbol(s): {', '.join(invalid)}")
+            sys.exit(1)
+        symbols = args.symbols
+    else:
+        symbols = [get_user_input(
+            "Enter stock symbol (e.g., IBM, AAPL, MSFT)",
+            default="IBM",
+            validator=validate_stock_symbol  # Ensures proper format
+        )]
     
-    # Generate unique filename with timestamp
+    # Generate unique filenames with timestamp
     # Format: stock_data_IBM_20240103_143022.json
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"stock_data_{stock_symbol}_{timestamp}.json"
     
     # Visual separator for cleaner output
     print()
     print("-" * 60)
 
-    # Step 1: Fetch data from API
-    stock_data = fetch_stock_data(api_url, api_key, stock_symbol)
+    # Step 1: Fetch data from API (all symbols at once)
+    results = fetch_all(api_url, api_key, symbols)
+
+    # Step 2: Save data for every symbol that was fetched successfully
+    saved = {}
+    failed = []
+    for symbol in symbols:
+        result = results[symbol]
+        if not result:
+            failed.append(symbol)
+            continue
 
-    # Step 2: Save data if fetch was successful
-    if stock_data:
+        # fetched_at is when the data came from the API; for a cached
+        # response that can be hours before this run
+        stock_data, fetched_at = result
+
+        filename = f"stock_data_{symbol}_{timestamp}.json"
         print()
-        success = save_data_to_file(stock_data, filename, stock_symbol)
-        
-        if success:
-            # Display success message
-            print()
-            print("=" * 60)
-            print(" Operation completed successfully!")
-            print(f" Stock data for {stock_symbol} saved to {filename}")
-            print("=" * 60)
+        if save_data_to_file(stock_data, filename, symbol, fetched_at):
+            saved[symbol] = filename
         else:
-            # Data fetched but couldn't save - non-zero exit code
-            print("\n  Data fetched but could not be saved")
-            sys.exit(1)  # Exit with error code 1
-    else:
-        # Data fetch failed - display helpful troubleshooting tips
+            # Data fetched but couldn't save
+            print(f"\n  Data for {symbol} fetched but could not be saved")
+            failed.append(symbol)
+
+    if saved:
+        # Display success message
+        print()
+        print("=" * 60)
+        if failed:
+            print(" Operation partly completed")
+        else:
+            print(" Operation completed successfully!")
+        for symbol, filename in saved.items():
+            print(f" Stock data for {symbol} saved to {filename}")
+        print("=" * 60)
+
+    if failed:
+        # Some or all fetches failed - display helpful troubleshooting tips
         print()
         print("=" * 60)
-        print(" Operation failed - no data to save")
+        print(f" Operation failed for: {', '.join(failed)}")
         print("=" * 60)
         print("\n Troubleshooting tips:")
         print("   • Check your API key is valid")
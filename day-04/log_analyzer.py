@@ -4,20 +4,43 @@ Log Analyzer Script
 Analyzes log files and generates summary reports
 """
 
-import json
+import argparse
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import orjson
 from datetime import datetime
 
 
+# Bytes decoded and split into lines at a time. Splitting big blocks
+# with str.split() is much cheaper than reading the file line by line.
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files at least this big are counted in parallel worker processes;
+# below it, starting the processes costs more than it saves
+PARALLEL_THRESHOLD = 64 * 1024 * 1024
+
+# Log lines joined into one string per write in the text report
+WRITE_BATCH = 4096
+
+# Format for one "LEVEL : count (percent%)" summary row,
+# parsed once here instead of on every call
+LEVEL_ROW = "{0:10} : {1:4} ({2:5.1f}%)".format
+
+
 def read_log_file(file_path):
     """
-    Reads log file and returns its content
+    Memory-maps the log file and returns the mapping.
+    The OS pages the file in as it is scanned, instead of Python first
+    reading it into a list of line strings.
     """
     try:
-        with open(file_path, "r") as file:
-            lines = file.readlines()
-            if not lines:
+        with open(file_path, "rb") as file:
+            if not file.seek(0, 2):
                 raise ValueError("Log file is empty")
-            return lines
+            # The mapping stays valid after the file object is closed
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
     except FileNotFoundError:
         print(f"ERROR: File '{file_path}' not found")
     except ValueError as error:
@@ -28,16 +51,62 @@ def read_log_file(file_path):
     return None
 
 
-def analyze_logs(log_lines):
+def chunk_bounds(log_data, chunk_size=CHUNK_SIZE, start=0, end=None):
     """
-    Analyzes log lines and counts log levels
+    Splits the mapped file (or the start..end part of it) into ranges of
+    about chunk_size bytes, each ending just after a line break
     """
-    log_counts = {
-        "INFO": 0,
-        "WARNING": 0,
-        "ERROR": 0
-    }
+    size = len(log_data) if end is None else end
+    while start < size:
+        chunk_end = start + chunk_size
+        if chunk_end >= size:
+            chunk_end = size
+        else:
+            newline = log_data.find(b"\n", chunk_end, size)
+            chunk_end = size if newline == -1 else newline + 1
+        yield start, chunk_end
+        start = chunk_end
+
+
+def read_block(log_data, start, end):
+    """
+    Decodes one newline-aligned block of the mapped file into text
+    """
+    return log_data[start:end].decode(errors="replace")
+
 
+def count_levels(log_data, start=0, end=None):
+    """
+    Counts log levels and non-blank lines between start and end.
+    Same rule as collect_details(), but only counts: lines are neither
+    stripped nor stored.
+    """
+    info = warning = error = 0
+    total_lines = 0
+
+    for block_start, block_end in chunk_bounds(log_data, start=start, end=end):
+        for line in read_block(log_data, block_start, block_end).split("\n"):
+            if "INFO" in line:
+                info += 1
+            elif "WARNING" in line:
+                warning += 1
+            elif "ERROR" in line:
+                error += 1
+            elif not line or line.isspace():
+                # Blank line: not a log entry
+                continue
+
+            total_lines += 1
+
+    return {"INFO": info, "WARNING": warning, "ERROR": error}, total_lines
+
+
+def collect_details(log_data):
+    """
+    Walks every line of the mapped file and sorts each
+    INFO/WARNING/ERROR line into its level. Returns the details and the
+    number of non-blank lines seen.
+    """
     log_details = {
         "INFO": [],
         "WARNING": [],
@@ -46,22 +115,71 @@ def analyze_logs(log_lines):
 
     total_lines = 0
 
-    for line in log_lines:
-        line = line.strip()
-        if not line:
-            continue
+    for block_start, block_end in chunk_bounds(log_data):
+        for line in read_block(log_data, block_start, block_end).split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+
+            total_lines += 1
+
+            if "INFO" in line:
+                log_details["INFO"].append(line)
+            elif "WARNING" in line:
+                log_details["WARNING"].append(line)
+            elif "ERROR" in line:
+                log_details["ERROR"].append(line)
 
-        total_lines += 1
+    return log_details, total_lines
 
-        if "INFO" in line:
-            log_counts["INFO"] += 1
-            log_details["INFO"].append(line)
-        elif "WARNING" in line:
-            log_counts["WARNING"] += 1
-            log_details["WARNING"].append(line)
-        elif "ERROR" in line:
-            log_counts["ERROR"] += 1
-            log_details["ERROR"].append(line)
+
+def count_file_range(file_path, start, end):
+    """
+    Worker process entry point: maps the file itself (mmap objects
+    can't be sent between processes) and counts one part of it
+    """
+    with open(file_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as log_data:
+            return count_levels(log_data, start, end)
+
+
+def analyze_logs(log_data, with_details=True, file_path=None, workers=None):
+    """
+    Analyzes the mapped log file and counts log levels.
+    With with_details=False only the counts are needed, so the cheaper
+    count_levels() pass is used. On files of PARALLEL_THRESHOLD bytes or
+    more it runs in one worker process per CPU (needs file_path).
+    The detail pass always runs in this process: sending every line back
+    from the workers costs about as much as collecting them here.
+    """
+    size = len(log_data)
+    workers = workers or os.cpu_count() or 1
+
+    if with_details:
+        log_details, total_lines = collect_details(log_data)
+        # Each counted line is stored in exactly one list
+        log_counts = {level: len(lines) for level, lines in log_details.items()}
+    elif file_path is None or workers == 1 or size < PARALLEL_THRESHOLD:
+        log_details = None
+        log_counts, total_lines = count_levels(log_data)
+    else:
+        log_details = None
+        ranges = list(chunk_bounds(log_data, chunk_size=size // workers + 1))
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            results = list(executor.map(
+                count_file_range,
+                [file_path] * len(ranges),
+                [start for start, end in ranges],
+                [end for start, end in ranges]
+            ))
+
+        # Add up the small per-range counts
+        log_counts = {"INFO": 0, "WARNING": 0, "ERROR": 0}
+        total_lines = 0
+        for part_counts, part_total in results:
+            total_lines += part_total
+            for level in log_counts:
+                log_counts[level] += part_counts[level]
 
     return {
         "counts": log_counts,
@@ -87,7 +205,7 @@ def print_summary(analysis):
     for level in ["INFO", "WARNING", "ERROR"]:
         count = counts[level]
         percentage = (count / total_messages * 100) if total_messages else 0
-        print(f"{level:10} : {count:4} ({percentage:5.1f}%)")
+        print(LEVEL_ROW(level, count, percentage))
 
     print("=" * 60)
 
@@ -99,36 +217,46 @@ def print_summary(analysis):
     print()
 
 
-def write_text_summary(analysis, output_file):
+def write_text_summary(analysis, output_file, generated_at):
     """
     Writes summary to a text file
     """
     try:
-        with open(output_file, "w") as file:
-            file.write("=" * 60 + "\n")
-            file.write("LOG ANALYSIS SUMMARY\n")
-            file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            file.write("=" * 60 + "\n\n")
-
-            file.write(f"Total log entries processed: {analysis['total_lines']}\n")
-            file.write("-" * 60 + "\n\n")
-
+        # A large buffer turns the few big writes below into few system calls
+        with open(output_file, "w", buffering=1 << 20) as file:
             counts = analysis["counts"]
             total_messages = sum(counts.values())
 
+            header = [
+                "=" * 60,
+                "LOG ANALYSIS SUMMARY",
+                f"Generated: {generated_at}",
+                "=" * 60,
+                "",
+                f"Total log entries processed: {analysis['total_lines']}",
+                "-" * 60,
+                ""
+            ]
+
             for level in ["INFO", "WARNING", "ERROR"]:
                 count = counts[level]
                 percentage = (count / total_messages * 100) if total_messages else 0
-                file.write(f"{level:10} : {count:4} ({percentage:5.1f}%)\n")
+                header.append(LEVEL_ROW(level, count, percentage))
 
-            file.write("\n" + "=" * 60 + "\n\n")
+            header += ["", "=" * 60, "", ""]
+            file.write("\n".join(header))
 
+            # Message listings are only available when details were collected
             for level in ["ERROR", "WARNING", "INFO"]:
-                if counts[level] > 0:
+                if analysis["details"] and counts[level] > 0:
                     file.write(f"{level} MESSAGES ({counts[level]}):\n")
                     file.write("-" * 60 + "\n")
-                    for message in analysis["details"][level]:
-                        file.write(message + "\n")
+                    # One joined write per batch of lines instead of one
+                    # write per line; batching keeps the joined copy small
+                    messages = analysis["details"][level]
+                    for start in range(0, len(messages), WRITE_BATCH):
+                        file.write("\n".join(messages[start:start + WRITE_BATCH]))
+                        file.write("\n")
                     file.write("\n")
 
         print(f" Text summary written to: {output_file}")
@@ -137,20 +265,39 @@ def write_text_summary(analysis, output_file):
         print(f"ERROR: Failed to write text summary: {error}")
 
 
-def write_json_summary(analysis, output_file):
+def write_json_summary(analysis, output_file, generated_at):
     """
-    Writes summary to a JSON file
+    Writes summary to a JSON file.
+    The header is serialized in one go; the message listings are streamed
+    one encoded line at a time, so no full copy of the report is built.
     """
     try:
         data = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": generated_at,
             "total_lines": analysis["total_lines"],
-            "summary": analysis["counts"],
-            "details": analysis["details"]
+            "summary": analysis["counts"]
         }
 
-        with open(output_file, "w") as file:
-            json.dump(data, file, indent=2)
+        with open(output_file, "wb", buffering=1 << 20) as file:
+            # Leave the object open ("\n}" removed) so details can follow
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2)[:-2])
+
+            if analysis["details"]:
+                file.write(b',\n  "details": {')
+                level_separator = b"\n    "
+                for level, messages in analysis["details"].items():
+                    file.write(level_separator + orjson.dumps(level) + b": [")
+                    level_separator = b",\n    "
+                    if not messages:
+                        file.write(b"]")
+                        continue
+                    file.write(b"\n      " + orjson.dumps(messages[0]))
+                    for message in islice(messages, 1, None):
+                        file.write(b",\n      " + orjson.dumps(message))
+                    file.write(b"\n    ]")
+                file.write(b"\n  }")
+
+            file.write(b"\n}")
 
         print(f" JSON summary written to: {output_file}")
 
@@ -158,10 +305,25 @@ def write_json_summary(analysis, output_file):
         print(f"ERROR: Failed to write JSON summary: {error}")
 
 
+def parse_args():
+    """
+    Reads command line options
+    """
+    parser = argparse.ArgumentParser(description="Analyze a log file and write summary reports")
+    parser.add_argument(
+        "--no-details",
+        action="store_true",
+        help="only count log levels; skip listing every message in the reports"
+    )
+    return parser.parse_args()
+
+
 def main():
     """
     Main execution function
     """
+    args = parse_args()
+
     log_file = "app.log"
     text_output = "log_summary.txt"
     json_output = "log_summary.json"
@@ -169,20 +331,31 @@ def main():
     print("\n Starting Log Analysis...")
     print(f" Reading log file: {log_file}")
 
-    log_lines = read_log_file(log_file)
-    if not log_lines:
+    log_data = read_log_file(log_file)
+    if not log_data:
         print("\n Log analysis failed")
         return
 
-    print(f" Successfully read {len(log_lines)} lines")
+    # The details are decoded copies, so the mapping can be
+    # closed as soon as the analysis is done
+    with log_data:
+        print(f" Successfully read {len(log_data):,} bytes")
 
-    analysis = analyze_logs(log_lines)
+        # Counts are cheap; the per-message details are only collected
+        # when the reports need them
+        analysis = analyze_logs(
+            log_data,
+            with_details=not args.no_details,
+            file_path=log_file
+        )
 
     print_summary(analysis)
 
     print(" Writing output files...")
-    write_text_summary(analysis, text_output)
-    write_json_summary(analysis, json_output)
+    # One timestamp shared by both reports
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    write_text_summary(analysis, text_output, generated_at)
+    write_json_summary(analysis, json_output, generated_at)
 
     print("\n Log analysis completed successfully!\n")
 